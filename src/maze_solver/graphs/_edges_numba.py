@@ -0,0 +1,64 @@
+"""Provide the Numba-compiled edge scan of the maze graph.
+
+This module holds the edge-discovery inner loop compiled with Numba.
+It is imported lazily by the converter module and only when Numba is
+installed; the converter falls back to its NumPy implementation
+otherwise.
+
+The module contains the following function:
+- `scan_edges`: A function that scans every node rightward and downward
+    for the next connectable node.
+"""
+import numpy as np
+from numba import njit  # pylint: disable=import-error
+
+
+@njit(cache=True)
+def scan_edges(
+    border_grid: np.ndarray,
+    node_mask: np.ndarray,
+    right: int,
+    bottom: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scans every node rightward and downward for the next connectable
+    node, stopping at blocking borders. The loop is compiled by Numba,
+    so the per-square walk runs without interpreter overhead.
+
+    Args:
+        border_grid (np.ndarray): A uint8 grid of the border values.
+        node_mask (np.ndarray): A boolean grid that is True on the
+            squares that act as nodes of the graph.
+        right (int): Value of the border that blocks a rightward step.
+        bottom (int): Value of the border that blocks a downward step.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The source and destination square
+            indices of the discovered edges as int32 arrays.
+    """
+    height, width = border_grid.shape
+    sources = np.empty(2 * height * width, dtype=np.int32)
+    destinations = np.empty(2 * height * width, dtype=np.int32)
+    count = 0
+    for row in range(height):
+        for column in range(width):
+            if not node_mask[row, column]:
+                continue
+            if not border_grid[row, column] & right:
+                for next_column in range(column + 1, width):
+                    if node_mask[row, next_column]:
+                        sources[count] = row * width + column
+                        destinations[count] = row * width + next_column
+                        count += 1
+                        break
+                    if border_grid[row, next_column] & right:
+                        break
+            if not border_grid[row, column] & bottom:
+                for next_row in range(row + 1, height):
+                    if node_mask[next_row, column]:
+                        sources[count] = row * width + column
+                        destinations[count] = next_row * width + column
+                        count += 1
+                        break
+                    if border_grid[next_row, column] & bottom:
+                        break
+    return sources[:count], destinations[:count]
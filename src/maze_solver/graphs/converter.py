@@ -0,0 +1,251 @@
+"""Provide the classes and functions that convert the maze into a graph.
+
+This module allows the conversion of the maze into a sparse graph whose
+nodes are the decision squares of the maze and whose weighted edges are
+the corridors between them.
+
+The module contains the following class:
+- `Edge`: A class that represents a weighted connection between two
+    squares of the maze.
+
+The module contains the following functions:
+- `make_graph`: A function that builds a SciPy CSR adjacency matrix of
+    the maze indexed by `Square.index`.
+- `get_nodes`: A function that collects the squares that act as nodes of
+    the graph.
+- `get_edges`: A function that connects the nodes lying in the same row
+    or column with no walls between them.
+- `get_directed_edges`: A function that returns the edges in both
+    directions.
+"""
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from maze_solver.models.border import _NODE_KIND_LUT, Border
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+from maze_solver.models.square import Square
+
+_NODE_KIND_ARR = np.frombuffer(_NODE_KIND_LUT, dtype=np.uint8)
+
+try:
+    from maze_solver.graphs._edges_numba import scan_edges
+except ImportError:
+    scan_edges = None
+
+
+class Edge(NamedTuple):
+    """A class that represents a weighted connection between two squares
+    of the maze. Extends NamedTuple.
+
+    Args:
+        node1: Square
+            Represents the source square of the edge.
+        node2: Square
+            Represents the destination square of the edge.
+
+    Methods:
+        flip(self) -> "Edge":
+            A getter method to get the same edge in the opposite
+            direction.
+        distance(self) -> float:
+            A getter method to get the Euclidean distance between both
+            squares.
+        weight(self, bonus: int = 1, penalty: int = 2) -> float:
+            A method to compute the cost of traversing the edge.
+    """
+
+    node1: Square
+    node2: Square
+
+    @property
+    def flip(self) -> "Edge":
+        """A getter method to get the same edge in the opposite
+        direction.
+
+        Returns:
+            Edge: The edge with both squares swapped.
+        """
+        return Edge(self.node2, self.node1)
+
+    @property
+    def distance(self) -> float:
+        """A getter method to get the Euclidean distance between both
+        squares. The distance is memoized, so repeated weight queries on
+        the same edge share a single computation.
+
+        Returns:
+            float: Distance between the two squares of the edge.
+        """
+        return _edge_distance(self)
+
+    def weight(self, bonus: int = 1, penalty: int = 2) -> float:
+        """A method to compute the cost of traversing the edge. Rewards
+        on the destination square make the edge cheaper, while enemies
+        make it more expensive.
+
+        Args:
+            bonus (int, optional): Discount applied when the destination
+                square holds a reward. Defaults to 1.
+            penalty (int, optional): Surcharge applied when the
+                destination square holds an enemy. Defaults to 2.
+
+        Returns:
+            float: Cost of traversing the edge.
+        """
+        match self.node2.role:
+            case Role.REWARD:
+                return self.distance - bonus
+            case Role.ENEMY:
+                return self.distance + penalty
+            case _:
+                return self.distance
+
+
+@lru_cache(maxsize=None)
+def _edge_distance(edge: Edge) -> float:
+    """Computes the Euclidean distance between the squares of an edge.
+    Memoized because the positions of the squares never change.
+
+    Args:
+        edge (Edge): Edge whose distance is computed.
+
+    Returns:
+        float: Distance between the two squares of the edge.
+    """
+    return math.dist(
+        (edge.node1.row, edge.node1.column),
+        (edge.node2.row, edge.node2.column),
+    )
+
+
+@lru_cache(maxsize=8)
+def make_graph(maze: Maze) -> tuple[csr_matrix, tuple[Square, ...]]:
+    """Builds a SciPy CSR adjacency matrix of the maze. Each directed
+    edge contributes one entry whose row and column are the
+    `Square.index` of its endpoints and whose value is the edge weight,
+    so the matrix can be handed straight to
+    `scipy.sparse.csgraph.dijkstra`. Since the maze is immutable, the
+    matrix is memoized so that repeated solves share a single build.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+
+    Returns:
+        tuple[csr_matrix, tuple[Square, ...]]: The adjacency matrix of
+            the maze and the mapping from matrix index to square.
+    """
+    edges = get_edges(maze, get_nodes(maze))
+    source, destination = edges[:, 0], edges[:, 1]
+    distances = np.hypot(
+        destination // maze.width - source // maze.width,
+        destination % maze.width - source % maze.width,
+    )
+    roles = maze._role_arr  # pylint: disable=protected-access
+    rows = np.concatenate([source, destination])
+    cols = np.concatenate([destination, source])
+    weights = np.concatenate([distances, distances]) + np.where(
+        roles[cols] == Role.REWARD,
+        -1.0,
+        np.where(roles[cols] == Role.ENEMY, 2.0, 0.0),
+    )
+    size = len(maze.squares)
+    return csr_matrix((weights, (rows, cols)), shape=(size, size)), (
+        maze.squares
+    )
+
+
+def get_nodes(maze: Maze) -> np.ndarray:
+    """Collects the squares that act as nodes of the graph, which are
+    the squares with a role and the corners, dead ends, and
+    intersections of the corridors. Exterior and wall squares never
+    become nodes.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+
+    Returns:
+        np.ndarray: A boolean grid of shape (height, width) that is True
+            on the squares that act as nodes of the graph.
+    """
+    border_grid = maze._border_grid  # pylint: disable=protected-access
+    role_grid = maze._role_grid  # pylint: disable=protected-access
+    node_mask = (_NODE_KIND_ARR[border_grid] != 0) | (
+        role_grid != Role.NONE
+    )
+    node_mask &= (role_grid != Role.EXTERIOR) & (role_grid != Role.WALL)
+    return node_mask
+
+
+# pylint: disable-next=too-many-locals
+def get_edges(maze: Maze, node_mask: np.ndarray) -> np.ndarray:
+    """Connects the nodes lying in the same row or column with no walls
+    between them by scanning rightward and downward from each node until
+    the next node or a blocking border.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+        node_mask (np.ndarray): A boolean grid that is True on the
+            squares that act as nodes of the graph.
+
+    Returns:
+        np.ndarray: An (M, 2) int32 array of source and destination
+            square indices, one row per edge.
+    """
+    border_grid = maze._border_grid  # pylint: disable=protected-access
+    size = len(maze.squares)
+    if scan_edges is not None:
+        sources, destinations = scan_edges(
+            border_grid, node_mask, int(Border.RIGHT), int(Border.BOTTOM)
+        )
+        keys = np.unique(sources.astype(np.int64) * size + destinations)
+        return np.column_stack(np.divmod(keys, size)).astype(np.int32)
+    pairs = []
+    for axis, border in ((1, Border.RIGHT), (0, Border.BOTTOM)):
+        # Number the corridor segments along the axis: a step from one
+        # square to the next is allowed unless the current square
+        # carries the blocking border, so two squares are connectable
+        # exactly when they share a segment number. Consecutive nodes of
+        # the same segment then form the edges of the scan.
+        grid = border_grid if axis == 1 else border_grid.T
+        mask = node_mask if axis == 1 else node_mask.T
+        segments = np.zeros(grid.shape, dtype=np.int64)
+        np.cumsum(
+            (grid[:, :-1] & border) != 0, axis=1, out=segments[:, 1:]
+        )
+        rows, cols = np.nonzero(mask)
+        connected = (rows[1:] == rows[:-1]) & (
+            segments[rows[1:], cols[1:]] == segments[rows[:-1], cols[:-1]]
+        )
+        indices = (
+            rows * maze.width + cols
+            if axis == 1
+            else cols * maze.width + rows
+        )
+        pairs.append(
+            np.column_stack((indices[:-1][connected], indices[1:][connected]))
+        )
+    stacked = np.concatenate(pairs, axis=0)
+    keys = np.unique(stacked[:, 0] * size + stacked[:, 1])
+    return np.column_stack(np.divmod(keys, size)).astype(np.int32)
+
+
+def get_directed_edges(maze: Maze, node_mask: np.ndarray) -> np.ndarray:
+    """Returns the edges of the graph in both directions so that the
+    adjacency matrix describes a directed graph.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+        node_mask (np.ndarray): A boolean grid that is True on the
+            squares that act as nodes of the graph.
+
+    Returns:
+        np.ndarray: An (2M, 2) int32 array of source and destination
+            square indices, one row per direction of each edge.
+    """
+    edges = get_edges(maze, node_mask)
+    return np.concatenate([edges, edges[:, ::-1]], axis=0)
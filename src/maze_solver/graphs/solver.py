@@ -0,0 +1,191 @@
+"""Provide the classes and functions that solve the maze.
+
+This module allows to find the shortest paths between the entrance and
+the exit of the maze. The maze is converted into a sparse adjacency
+matrix and the shortest distances are computed with the C-implemented
+Dijkstra of `scipy.sparse.csgraph`, so only the path reconstruction runs
+in Python.
+
+Examples:
+
+    >>> from pathlib import Path
+    >>> from maze_solver.graphs.solver import solve
+    >>> from maze_solver.models.maze import Maze
+
+    >>> maze = Maze.load(Path("mazes") / "miniature.maze")
+    >>> solution = solve(maze)
+    >>> len(solution)
+    6
+
+The module contains the following class:
+- `Solver`: A class that solves a maze while sharing a single graph
+    build and Dijkstra run between queries.
+
+The module contains the following functions:
+- `solve`: A function that finds the shortest path of the maze.
+- `solve_all`: A function that finds all the shortest paths of the maze.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from maze_solver.graphs.converter import make_graph
+from maze_solver.models.maze import Maze
+from maze_solver.models.solution import Solution
+from maze_solver.models.square import Square
+
+
+@dataclass(frozen=True)
+class Solver:
+    """A class that solves a maze. The adjacency matrix and the Dijkstra
+    distances and predecessors are computed lazily and cached, so
+    querying the shortest path and all the shortest paths of the same
+    maze shares a single build.
+
+    Attributes:
+        maze: Maze
+            Represents the maze to be solved.
+
+    Methods:
+        shortest(self) -> Solution | None:
+            A method to find the shortest path of the maze.
+        all_shortest(self) -> list[Solution]:
+            A method to find all the shortest paths of the maze.
+    """
+
+    maze: Maze
+
+    @cached_property
+    def _graph(self) -> csr_matrix:
+        """A cached getter method to get the adjacency matrix of the
+        maze.
+
+        Returns:
+            csr_matrix: The adjacency matrix of the maze.
+        """
+        return make_graph(self.maze)[0]
+
+    @cached_property
+    def _squares(self) -> tuple[Square, ...]:
+        """A cached getter method to get the mapping from matrix index
+        to square.
+
+        Returns:
+            tuple[Square, ...]: The squares of the maze.
+        """
+        return make_graph(self.maze)[1]
+
+    @cached_property
+    def _dijkstra(self) -> tuple[np.ndarray, np.ndarray]:
+        """A cached getter method to get the shortest distances from the
+        entrance to every square, along with the predecessor of every
+        square on its shortest path.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The distances and the
+                predecessors computed by Dijkstra.
+        """
+        return dijkstra(
+            self._graph,
+            indices=self.maze.entrance.index,
+            return_predecessors=True,
+        )
+
+    def shortest(self) -> Solution | None:
+        """Finds the shortest path between the entrance and the exit of
+        the maze by walking the Dijkstra predecessors from the exit back
+        to the entrance.
+
+        Returns:
+            Solution | None: The shortest path of the maze, or None when
+                the exit cannot be reached from the entrance.
+        """
+        distances, predecessors = self._dijkstra
+        if np.isinf(distances[self.maze.exit.index]):
+            return None
+        path = [self.maze.exit.index]
+        while path[-1] != self.maze.entrance.index:
+            path.append(int(predecessors[path[-1]]))
+        return Solution(
+            squares=tuple(self._squares[index] for index in reversed(path))
+        )
+
+    def all_shortest(self) -> list[Solution]:
+        """Finds all the shortest paths between the entrance and the
+        exit of the maze by enumerating every entrance-to-exit path over
+        the subgraph of edges that preserve the shortest distance.
+
+        Returns:
+            list[Solution]: All the shortest paths of the maze, or an
+                empty list when the exit cannot be reached from the
+                entrance.
+        """
+        distances, _ = self._dijkstra
+        if np.isinf(distances[self.maze.exit.index]):
+            return []
+        # Filter the shortest-path DAG in one vectorized pass: an edge
+        # belongs to it exactly when it preserves the shortest distance.
+        graph = self._graph
+        sources = np.repeat(
+            np.arange(graph.shape[0]), np.diff(graph.indptr)
+        )
+        preserving = np.isclose(
+            distances[sources] + graph.data, distances[graph.indices]
+        )
+        dag: dict[int, list[int]] = {}
+        for source, destination in zip(
+            sources[preserving].tolist(), graph.indices[preserving].tolist()
+        ):
+            dag.setdefault(source, []).append(destination)
+        solutions: list[Solution] = []
+        path = [self.maze.entrance.index]
+
+        def walk(node: int) -> None:
+            if node == self.maze.exit.index:
+                solutions.append(
+                    Solution(
+                        squares=tuple(self._squares[index] for index in path)
+                    )
+                )
+                return
+            for following in dag.get(node, ()):
+                path.append(following)
+                walk(following)
+                path.pop()
+
+        walk(self.maze.entrance.index)
+        return solutions
+
+
+def solve(maze: Maze) -> Solution | None:
+    """Finds the shortest path between the entrance and the exit of the
+    maze. Thin wrapper around `Solver.shortest`; callers querying the
+    same maze repeatedly should hold on to a `Solver` instead.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+
+    Returns:
+        Solution | None: The shortest path of the maze, or None when the
+            exit cannot be reached from the entrance.
+    """
+    return Solver(maze).shortest()
+
+
+def solve_all(maze: Maze) -> list[Solution]:
+    """Finds all the shortest paths between the entrance and the exit of
+    the maze. Thin wrapper around `Solver.all_shortest`; callers
+    querying the same maze repeatedly should hold on to a `Solver`
+    instead.
+
+    Args:
+        maze (Maze): Object that represents the maze.
+
+    Returns:
+        list[Solution]: All the shortest paths of the maze, or an empty
+            list when the exit cannot be reached from the entrance.
+    """
+    return Solver(maze).all_shortest()
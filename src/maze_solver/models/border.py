@@ -37,10 +37,18 @@ Examples:
 
 The module contains the following class:
 - `Border(IntFlag):`: A class that represents a enum for the roles
+
+The module contains the following functions:
+- `is_node_border`: A function that checks if a border value makes its
+    square a node of the maze graph.
 """
 
 from enum import IntFlag, auto
 
+# Borders fit in 4 bits, so the popcount of every possible value is
+# precomputed and looked up instead of calling bit_count per square.
+_POPCNT: bytes = bytes(bin(value).count("1") for value in range(16))
+
 
 class Border(IntFlag):
     """A class that handles the border of each node or square in the maze.
@@ -83,12 +91,7 @@ class Border(IntFlag):
         Returns:
             bool: True if it has a corner border or false if not.
         """
-        return self in (
-            self.TOP | self.LEFT,
-            self.TOP | self.RIGHT,
-            self.BOTTOM | self.LEFT,
-            self.BOTTOM | self.RIGHT,
-        )
+        return self in _CORNERS
 
     @property
     def dead_end(self) -> bool:
@@ -97,7 +100,7 @@ class Border(IntFlag):
         Returns:
             bool: True if it has a dead end border or false if not.
         """
-        return self.bit_count() == 3
+        return _POPCNT[self] == 3
 
     @property
     def intersection(self) -> bool:
@@ -106,4 +109,39 @@ class Border(IntFlag):
         Returns:
             bool: True if it is an intersection or false if not.
         """
-        return self.bit_count() < 2
+        return _POPCNT[self] < 2
+
+
+_CORNERS: frozenset[Border] = frozenset(
+    {
+        Border.TOP | Border.LEFT,
+        Border.TOP | Border.RIGHT,
+        Border.BOTTOM | Border.LEFT,
+        Border.BOTTOM | Border.RIGHT,
+    }
+)
+
+_NODE_KIND_LUT: bytes = bytes(
+    (
+        Border(value).corner
+        | (Border(value).dead_end << 1)
+        | (Border(value).intersection << 2)
+    )
+    for value in range(16)
+)
+
+
+def is_node_border(value: int) -> bool:
+    """Checks if a border value makes its square a node of the maze
+    graph, which is the case for corners, dead ends, and intersections.
+    The answer is precomputed for the 16 possible border values, so the
+    check is a single table lookup.
+
+    Args:
+        value (int): Value of the border to be checked.
+
+    Returns:
+        bool: True if the border makes its square a node or false if
+            not.
+    """
+    return _NODE_KIND_LUT[value] != 0
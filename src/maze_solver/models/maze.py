@@ -75,6 +75,8 @@ from functools import cached_property
 from pathlib import Path
 from typing import Iterator
 
+import numpy as np
+
 from maze_solver.models.role import Role
 from maze_solver.models.square import Square
 from maze_solver.persistence.serializer import dump_squares, load_squares
@@ -137,7 +139,7 @@ class Maze:
         Returns:
             void: Prints the width of the maze.
         """
-        return max(square.column for square in self) + 1
+        return self.squares[-1].column + 1
 
     @cached_property
     def height(self):
@@ -146,7 +148,90 @@ class Maze:
         Returns:
             void: Prints the height of the maze.
         """
-        return max(square.row for square in self) + 1
+        return self.squares[-1].row + 1
+
+    @cached_property
+    def _square_values(self) -> np.ndarray:
+        """A cached getter method to get the packed role and border
+        value of every square, in the same single-byte layout used by
+        the maze file format, as a NumPy array indexed by square index.
+
+        Returns:
+            np.ndarray: The packed square values as a uint8 array.
+        """
+        return np.fromiter(
+            ((square.role << 4) | square.border for square in self.squares),
+            dtype=np.uint8,
+            count=len(self.squares),
+        )
+
+    @cached_property
+    def _border_arr(self) -> np.ndarray:
+        """A cached getter method to get the border values of the maze
+        as a NumPy array indexed by square index.
+
+        Returns:
+            np.ndarray: The border values as a uint8 array.
+        """
+        return self._square_values & 0xF
+
+    @cached_property
+    def _role_arr(self) -> np.ndarray:
+        """A cached getter method to get the role values of the maze
+        as a NumPy array indexed by square index.
+
+        Returns:
+            np.ndarray: The role values as a uint8 array.
+        """
+        return self._square_values >> 4
+
+    @cached_property
+    def _row_arr(self) -> np.ndarray:
+        """A cached getter method to get the row of every square as a
+        NumPy array indexed by square index.
+
+        Returns:
+            np.ndarray: The rows as an int32 array.
+        """
+        return np.fromiter(
+            (square.row for square in self.squares),
+            dtype=np.int32,
+            count=len(self.squares),
+        )
+
+    @cached_property
+    def _column_arr(self) -> np.ndarray:
+        """A cached getter method to get the column of every square as
+        a NumPy array indexed by square index.
+
+        Returns:
+            np.ndarray: The columns as an int32 array.
+        """
+        return np.fromiter(
+            (square.column for square in self.squares),
+            dtype=np.int32,
+            count=len(self.squares),
+        )
+
+    @cached_property
+    def _border_grid(self) -> np.ndarray:
+        """A cached getter method to get the border values of the maze
+        as a NumPy grid of shape (height, width).
+
+        Returns:
+            np.ndarray: The border values as a uint8 grid.
+        """
+        return self._border_arr.reshape(self.height, self.width)
+
+    @cached_property
+    def _role_grid(self) -> np.ndarray:
+        """A cached getter method to get the role values of the maze
+        as a NumPy grid of shape (height, width).
+
+        Returns:
+            np.ndarray: The role values as a uint8 grid.
+        """
+        return self._role_arr.reshape(self.height, self.width)
 
     @cached_property
     def entrance(self) -> Square:
@@ -155,7 +240,9 @@ class Maze:
         Returns:
             Square: The square with ENTRANCE role.
         """
-        return next(sq for sq in self if sq.role is Role.ENTRANCE)
+        return self.squares[
+            int(np.flatnonzero(self._role_arr == Role.ENTRANCE)[0])
+        ]
 
     @cached_property
     def exit(self) -> Square:
@@ -164,7 +251,9 @@ class Maze:
         Returns:
             Square: The square with EXIT role.
         """
-        return next(sq for sq in self if sq.role is Role.EXIT)
+        return self.squares[
+            int(np.flatnonzero(self._role_arr == Role.EXIT)[0])
+        ]
 
     def dump(self, path: Path) -> None:
         """A method that writes a file in the path given.
@@ -183,8 +272,13 @@ def validate_indices(maze: Maze) -> None:
     Args:
         maze (Maze): Represents the maze to be validated.
     """
-    assert [square.index for square in maze] == list(
-        range(len(maze.squares))
+    indices = np.fromiter(
+        (square.index for square in maze),
+        dtype=np.int64,
+        count=len(maze.squares),
+    )
+    assert np.array_equal(
+        indices, np.arange(len(maze.squares))
     ), "Wrong square.index"
 
 
@@ -196,11 +290,14 @@ def validate_rows_columns(maze: Maze) -> None:
     Args:
         maze (Maze): Represents the maze to be validated.
     """
-    for y_height in range(maze.height):
-        for x_width in range(maze.width):
-            square = maze[y_height * maze.width + x_width]
-            assert square.row == y_height, "Wrong square.row"
-            assert square.column == x_width, "Wrong square.column"
+    assert np.array_equal(
+        maze._row_arr,  # pylint: disable=protected-access
+        np.repeat(np.arange(maze.height), maze.width),
+    ), "Wrong square.row"
+    assert np.array_equal(
+        maze._column_arr,  # pylint: disable=protected-access
+        np.tile(np.arange(maze.width), maze.height),
+    ), "Wrong square.column"
 
 
 def validate_entrance(maze: Maze) -> None:
@@ -12,9 +12,10 @@ The module contains the following functions:
 """
 
 from dataclasses import dataclass
-from functools import reduce
 from typing import Iterator
 
+import numpy as np
+
 from maze_solver.models.role import Role
 from maze_solver.models.square import Square
 
@@ -46,7 +47,19 @@ class Solution:
     def __post_init__(self) -> None:
         assert self.squares[0].role is Role.ENTRANCE
         assert self.squares[-1].role is Role.EXIT
-        reduce(validate_corridor, self.squares)
+        rows = np.fromiter(
+            (square.row for square in self.squares),
+            dtype=np.int64,
+            count=len(self.squares),
+        )
+        columns = np.fromiter(
+            (square.column for square in self.squares),
+            dtype=np.int64,
+            count=len(self.squares),
+        )
+        assert np.all(
+            (rows[1:] == rows[:-1]) | (columns[1:] == columns[:-1])
+        ), "Squares must lie in the same row or column"
 
     def __iter__(self) -> Iterator[Square]:
         return iter(self.squares)
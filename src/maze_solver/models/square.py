@@ -42,3 +42,9 @@ class Square:
     column: int
     border: Border
     role: Role = Role.NONE
+
+    def __hash__(self) -> int:
+        # The index uniquely identifies a square within its maze, so
+        # hashing it alone is enough; equal squares share it, keeping
+        # the hash consistent with the field-wise equality.
+        return self.index
@@ -7,13 +7,17 @@ The module contains the following classes:
     the border of the square in SVG.
 - `FileBody`: A class that represents the body of the maze file.
 """
-import array
 import struct
 from dataclasses import dataclass
 from typing import BinaryIO
 
 MAGIC_NUMBER: bytes = b"MAZE"
 
+# The header after the magic number is one fixed-size record: a single
+# byte for the format version followed by the width and the height as
+# little-endian unsigned integers.
+_HEADER_STRUCT = struct.Struct("<B2I")
+
 
 @dataclass(frozen=True)
 class FileHeader:
@@ -44,11 +48,13 @@ class FileHeader:
             FileHeader: Instance of the FileHeader class with the
                 information from the file.
         """
+        data = file.read(len(MAGIC_NUMBER) + _HEADER_STRUCT.size)
         assert (
-            file.read(len(MAGIC_NUMBER)) == MAGIC_NUMBER
+            data[: len(MAGIC_NUMBER)] == MAGIC_NUMBER
         ), "Unknown file type"  # one line
-        (format_version,) = struct.unpack("B", file.read(1))
-        width, height = struct.unpack("<2I", file.read(2 * 4))
+        format_version, width, height = _HEADER_STRUCT.unpack(
+            data[len(MAGIC_NUMBER):]
+        )
         return cls(format_version, width, height)
 
     def write(self, file: BinaryIO) -> None:
@@ -58,9 +64,10 @@ class FileHeader:
             file (BinaryIO): Binary file where FileHeader object writes
                 its content.
         """
-        file.write(MAGIC_NUMBER)
-        file.write(struct.pack("B", self.format_version))
-        file.write(struct.pack("<2I", self.width, self.height))
+        file.write(
+            MAGIC_NUMBER
+            + _HEADER_STRUCT.pack(self.format_version, self.width, self.height)
+        )
 
 
 @dataclass(frozen=True)
@@ -75,7 +82,7 @@ class FileBody:
             Writes its own content into a supplied binary file.
     """
 
-    square_values: array.array
+    square_values: bytes
 
     @classmethod
     def read(cls, header: FileHeader, file: BinaryIO) -> "FileBody":
@@ -90,7 +97,7 @@ class FileBody:
         Returns:
             FileBody: Representation of the FileBody
         """
-        return cls(array.array("B", file.read(header.width * header.height)))
+        return cls(file.read(header.width * header.height))
 
     def write(self, file: BinaryIO) -> None:
         """Writes its own content into a supplied binary file.
@@ -99,4 +106,4 @@ class FileBody:
             file (BinaryIO): Binary file where FileObject object writes
                 its content.
         """
-        file.write(self.square_values.tobytes())
+        file.write(self.square_values)
@@ -70,9 +70,10 @@ The module contains the following functions:
 - `decompress`: Decompress a single number to two values (square roles and
     square border value).
 """
-import array
+import io
 import pathlib
-from typing import Iterator
+
+import numpy as np
 
 from maze_solver.models.border import Border
 from maze_solver.models.role import Role
@@ -81,6 +82,12 @@ from maze_solver.persistence.file_format import FileBody, FileHeader
 
 FORMAT_VERSION: int = 1
 
+# Constructing an IntFlag or IntEnum walks the member registry, so the
+# 16 possible borders and the roles are materialized once and looked up
+# by value afterwards.
+_BORDERS: tuple[Border, ...] = tuple(Border(value) for value in range(16))
+_ROLES: tuple[Role, ...] = tuple(Role)
+
 
 def dump_squares(
     width: int, height: int, squares: tuple[Square, ...], path: pathlib.Path
@@ -92,14 +99,16 @@ def dump_squares(
         path (pathlib.Path): Path where to write the maze file.
     """
     header, body = serialize(width, height, squares)
+    buffer = io.BytesIO()
+    header.write(buffer)
+    body.write(buffer)
     with path.open(mode="wb") as file:
-        header.write(file)
-        body.write(file)
+        file.write(buffer.getvalue())
 
 
-def load_squares(path: pathlib.Path) -> Iterator[Square]:
+def load_squares(path: pathlib.Path) -> list[Square]:
     """Open the file for reading in binary mode to option the file header
-    obtain its file version and obtain its body and returns a iteration of
+    obtain its file version and obtain its body and returns the list of
     squares.
 
     Args:
@@ -132,24 +141,51 @@ def serialize(
         the file body.
     """
     header = FileHeader(FORMAT_VERSION, width, height)
-    body = FileBody(array.array("B", map(compress, squares)))
+    roles = np.fromiter(
+        (square.role for square in squares),
+        dtype=np.uint8,
+        count=len(squares),
+    )
+    borders = np.fromiter(
+        (square.border for square in squares),
+        dtype=np.uint8,
+        count=len(squares),
+    )
+    packed = (roles << np.uint8(4)) | borders
+    body = FileBody(packed.tobytes())
     return header, body
 
 
-def deserialize(header: FileHeader, body: FileBody) -> Iterator[Square]:
-    """Process the file header and body to create a iteration of squares.
+def deserialize(header: FileHeader, body: FileBody) -> list[Square]:
+    """Process the file header and body to create the squares. The
+    packed bytes are split into border and role values with two
+    vectorized NumPy operations and the grid coordinates come from a
+    single np.divmod over the square indices.
 
     Args:
         header (FileHeader): Represents the file header of the maze.
         body (FileBody): Represents the file body of the maze.
 
     Returns:
-        Maze: Represents the maze as an object
+        list[Square]: Represents the squares of the maze.
     """
-    for index, square_value in enumerate(body.square_values):
-        row, column = divmod(index, header.width)
-        border, role = decompress(square_value)
-        yield Square(index, row, column, border, role)
+    values = np.frombuffer(body.square_values, dtype=np.uint8)
+    borders = values & 0x0F
+    roles = values >> 4
+    rows, columns = np.divmod(
+        np.arange(values.size, dtype=np.int32), header.width
+    )
+    return [
+        Square(index, row, column, _BORDERS[border], _ROLES[role])
+        for index, (row, column, border, role) in enumerate(
+            zip(
+                rows.tolist(),
+                columns.tolist(),
+                borders.tolist(),
+                roles.tolist(),
+            )
+        )
+    ]
 
 
 def compress(square: Square) -> int:
@@ -176,4 +212,4 @@ def decompress(square_value: int) -> tuple[Border, Role]:
         tuple[Border, Role]: Represents the border and role value of the
             square.
     """
-    return Border(square_value & 0xF), Role(square_value >> 4)
+    return _BORDERS[square_value & 0xF], _ROLES[square_value >> 4]
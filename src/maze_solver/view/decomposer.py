@@ -5,7 +5,12 @@ This module allows the creation of xml tags for rendering.
 The module contains the following functions:
 - `decompose`: A function that returns a geometric primitive that represents
     the border of the square in SVG.
+- `decompose_all`: A function that returns the SVG fragments of many
+    borders in bulk.
 """
+from functools import lru_cache
+from typing import Callable, Iterable
+
 from maze_solver.models.border import Border
 from maze_solver.view.primitives import (
     DisjointLines,
@@ -15,11 +20,112 @@ from maze_solver.view.primitives import (
     Polygon,
     Polyline,
     Primitive,
+    _format_attributes,
 )
 
+_NULL = NullPrimitive()
+
+
+@lru_cache(maxsize=4096)
+def _point(x: int, y: int) -> Point:
+    """Builds a point, pooling the instances. Neighboring squares share
+    their corner coordinates on the fixed grid, so pooling avoids
+    reallocating the same points over and over during a render.
+
+    Args:
+        x (int): Represents the position of the point on the X-axis.
+        y (int): Represents the position of the point on the Y-axis.
+
+    Returns:
+        Point: The pooled point for the coordinates.
+    """
+    return Point(x, y)
+
+
+def _corners(top_left: Point, size: int) -> tuple[Point, Point, Point, Point]:
+    """Builds the four corner points of a square in clockwise order
+    starting from the top left.
+
+    Args:
+        top_left (Point): Represents the top left point of the square.
+        size (int): Represents the size of the side of the square.
+
+    Returns:
+        tuple[Point, Point, Point, Point]: The top left, top right,
+            bottom right, and bottom left points of the square.
+    """
+    return (
+        top_left,
+        _point(top_left.x + size, top_left.y),
+        _point(top_left.x + size, top_left.y + size),
+        _point(top_left.x, top_left.y + size),
+    )
+
+
+def _ring(
+    primitive: Callable[[list[Point]], Primitive], *order: int
+) -> Callable[[Point, int], Primitive]:
+    """Builds a handler that connects the corners of the square in the
+    given order. The handler constructs only the points it draws.
+
+    Args:
+        primitive (Callable[[list[Point]], Primitive]): Primitive that
+            connects the corner points.
+
+    Returns:
+        Callable[[Point, int], Primitive]: The handler for the border
+            value.
+    """
+
+    def handler(top_left: Point, size: int) -> Primitive:
+        corners = _corners(top_left, size)
+        return primitive([corners[position] for position in order])
+
+    return handler
+
+
+# The 16 possible border values are dispatched through a table built at
+# import instead of a chain of flag comparisons per call. Each handler
+# receives the top left point and the square size and allocates only
+# the points and lines of the primitive it returns; corner positions in
+# the ring orders are 0=top left, 1=top right, 2=bottom right, and
+# 3=bottom left.
+_DISPATCH: dict[int, Callable[[Point, int], Primitive]] = {
+    int(Border.LEFT | Border.TOP | Border.RIGHT | Border.BOTTOM): (
+        _ring(Polygon, 0, 1, 2, 3)
+    ),
+    int(Border.BOTTOM | Border.LEFT | Border.TOP): _ring(Polyline, 2, 3, 0, 1),
+    int(Border.LEFT | Border.TOP | Border.RIGHT): _ring(Polyline, 3, 0, 1, 2),
+    int(Border.TOP | Border.RIGHT | Border.BOTTOM): _ring(Polyline, 0, 1, 2, 3),
+    int(Border.RIGHT | Border.BOTTOM | Border.LEFT): _ring(Polyline, 1, 2, 3, 0),
+    int(Border.LEFT | Border.TOP): _ring(Polyline, 3, 0, 1),
+    int(Border.TOP | Border.RIGHT): _ring(Polyline, 0, 1, 2),
+    int(Border.BOTTOM | Border.LEFT): _ring(Polyline, 2, 3, 0),
+    int(Border.RIGHT | Border.BOTTOM): _ring(Polyline, 1, 2, 3),
+    int(Border.LEFT | Border.RIGHT): lambda tl, s: DisjointLines(
+        [
+            Line(tl, _point(tl.x, tl.y + s)),
+            Line(_point(tl.x + s, tl.y), _point(tl.x + s, tl.y + s)),
+        ]
+    ),
+    int(Border.TOP | Border.BOTTOM): lambda tl, s: DisjointLines(
+        [
+            Line(tl, _point(tl.x + s, tl.y)),
+            Line(_point(tl.x, tl.y + s), _point(tl.x + s, tl.y + s)),
+        ]
+    ),
+    int(Border.TOP): lambda tl, s: Line(tl, _point(tl.x + s, tl.y)),
+    int(Border.RIGHT): lambda tl, s: Line(
+        _point(tl.x + s, tl.y), _point(tl.x + s, tl.y + s)
+    ),
+    int(Border.BOTTOM): lambda tl, s: Line(
+        _point(tl.x, tl.y + s), _point(tl.x + s, tl.y + s)
+    ),
+    int(Border.LEFT): lambda tl, s: Line(tl, _point(tl.x, tl.y + s)),
+    int(Border.EMPTY): lambda tl, s: _NULL,
+}
+
 
-# pylint: disable=too-many-return-statements
-# pylint: disable=too-many-branches
 def decompose(border: Border, top_left: Point, sq_size: int) -> Primitive:
     """A function that returns a geometric primitive that represents
     the border of the square in SVG.
@@ -33,117 +139,92 @@ def decompose(border: Border, top_left: Point, sq_size: int) -> Primitive:
         Primitive: geometric primitive that represents the border of the
             square in SVG.
     """
-    top_right: Point = top_left.translate(x_pos=sq_size)
-    bottom_right: Point = top_left.translate(x_pos=sq_size, y_pos=sq_size)
-    bottom_left: Point = top_left.translate(y_pos=sq_size)
-
-    top = Line(top_left, top_right)
-    bottom = Line(bottom_left, bottom_right)
-    left = Line(top_left, bottom_left)
-    right = Line(top_right, bottom_right)
-
-    if border is Border.LEFT | Border.TOP | Border.RIGHT | Border.BOTTOM:
-        return Polygon(
-            [
-                top_left,
-                top_right,
-                bottom_right,
-                bottom_left,
-            ]
-        )
-
-    if border is Border.BOTTOM | Border.LEFT | Border.TOP:
-        return Polyline(
-            [
-                bottom_right,
-                bottom_left,
-                top_left,
-                top_right,
-            ]
-        )
+    return _DISPATCH[border.value](top_left, sq_size)
 
-    if border is Border.LEFT | Border.TOP | Border.RIGHT:
-        return Polyline(
-            [
-                bottom_left,
-                top_left,
-                top_right,
-                bottom_right,
-            ]
-        )
-
-    if border is Border.TOP | Border.RIGHT | Border.BOTTOM:
-        return Polyline(
-            [
-                top_left,
-                top_right,
-                bottom_right,
-                bottom_left,
-            ]
-        )
 
-    if border is Border.RIGHT | Border.BOTTOM | Border.LEFT:
-        return Polyline(
-            [
-                top_right,
-                bottom_right,
-                bottom_left,
-                top_left,
-            ]
-        )
+@lru_cache(maxsize=None)
+def _emitter(
+    border_value: int, sq_size: int, attributes_items: tuple
+) -> tuple[str, tuple[int, ...]]:
+    """Precomputes the SVG fragment of a border value as a %-template
+    plus the coordinate offsets that fill it. The template embeds the
+    formatted attributes, so emitting the fragment of one square is a
+    single string interpolation.
 
-    if border is Border.LEFT | Border.TOP:
-        return Polyline(
-            [
-                bottom_left,
-                top_left,
-                top_right,
-            ]
-        )
+    Args:
+        border_value (int): Value of the border to be drawn.
+        sq_size (int): Represents the size of the side of the square.
+        attributes_items (tuple): Key-value pairs of the attributes.
 
-    if border is Border.TOP | Border.RIGHT:
-        return Polyline(
-            [
-                top_left,
-                top_right,
-                bottom_right,
-            ]
+    Returns:
+        tuple[str, tuple[int, ...]]: The fragment template and the flat
+            x/y offsets of its coordinates.
+    """
+    primitive = _DISPATCH[border_value](_point(0, 0), sq_size)
+    # The attributes become part of a %-template, so any literal % in
+    # a value, e.g. an opacity of "50%", must be escaped to survive
+    # the later interpolation.
+    attrs = _format_attributes(dict(attributes_items)).replace("%", "%%")
+    if isinstance(primitive, (Polygon, Polyline)):
+        name = "polygon" if isinstance(primitive, Polygon) else "polyline"
+        points = " ".join(["%d,%d"] * len(primitive))
+        template = f'<{name} points="{points}"{attrs} />'
+        offsets = tuple(
+            offset for point in primitive for offset in (point.x, point.y)
         )
+        return template, offsets
+    if isinstance(primitive, Line):
+        lines: tuple[Line, ...] = (primitive,)
+    elif isinstance(primitive, DisjointLines):
+        lines = tuple(primitive)
+    else:
+        return "", ()
+    line_template = f'<line x1="%d" y1="%d" x2="%d" y2="%d"{attrs} />'
+    template = "".join([line_template] * len(lines))
+    offsets = tuple(
+        offset
+        for line in lines
+        for point in line
+        for offset in (point.x, point.y)
+    )
+    return template, offsets
+
+
+def decompose_all(
+    border_values: Iterable[int],
+    xs: Iterable[int],
+    ys: Iterable[int],
+    sq_size: int,
+    **attributes,
+) -> list[str]:
+    """A function that returns the SVG fragments of many borders in
+    bulk. The fragment of each of the 16 border values is precomputed
+    once as a template, so the per-square work reduces to offsetting
+    its coordinates.
 
-    if border is Border.BOTTOM | Border.LEFT:
-        return Polyline(
-            [
-                bottom_right,
-                bottom_left,
-                top_left,
-            ]
-        )
+    Args:
+        border_values (Iterable[int]): Values of the borders to be
+            drawn.
+        xs (Iterable[int]): X coordinates of the top left points.
+        ys (Iterable[int]): Y coordinates of the top left points.
+        sq_size (int): Represents the size of the side of the square.
 
-    if border is Border.RIGHT | Border.BOTTOM:
-        return Polyline(
-            [
-                top_right,
-                bottom_right,
-                bottom_left,
-            ]
+    Returns:
+        list[str]: The SVG fragments of the borders, in input order.
+    """
+    items = tuple(attributes.items())
+    emitters = [_emitter(value, sq_size, items) for value in range(16)]
+    fragments = []
+    append = fragments.append
+    for value, x, y in zip(border_values, xs, ys):
+        template, offsets = emitters[value]
+        append(
+            template
+            % tuple(
+                coordinate + offset
+                for coordinate, offset in zip(
+                    (x, y) * (len(offsets) // 2), offsets
+                )
+            )
         )
-
-    if border is Border.LEFT | Border.RIGHT:
-        return DisjointLines([left, right])
-
-    if border is Border.TOP | Border.BOTTOM:
-        return DisjointLines([top, bottom])
-
-    if border is Border.TOP:
-        return top
-
-    if border is Border.RIGHT:
-        return right
-
-    if border is Border.BOTTOM:
-        return bottom
-
-    if border is Border.LEFT:
-        return left
-
-    return NullPrimitive()
+    return fragments
@@ -46,8 +46,90 @@ The module contains the following functions:
     the maze entrance, the last square is the exit, and every two consecutive
     squares belong to the same row or column.
 """
+import array
 from dataclasses import dataclass
-from typing import NamedTuple, Protocol
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, NamedTuple, Protocol
+
+_HYPHENATED: dict[str, str] = {}
+_UNDERSCORE_TO_HYPHEN = str.maketrans("_", "-")
+
+
+def _hyphenate(key: str) -> str:
+    """Translates an attribute name to its hyphenated form. The names
+    come from a small fixed vocabulary, so the translations are cached
+    in a module-level dict and each name is converted only once.
+
+    Args:
+        key (str): Name of the attribute to be translated.
+
+    Returns:
+        str: The attribute name with underscores turned into hyphens.
+    """
+    translated = _HYPHENATED.get(key)
+    if translated is None:
+        translated = key.translate(_UNDERSCORE_TO_HYPHEN)
+        _HYPHENATED[key] = translated
+    return translated
+
+
+def _format_attributes(attributes: dict) -> str:
+    """Formats key-value attributes as a string of XML attributes,
+    prefixed with a separating space when any are present.
+
+    Args:
+        attributes (dict): Attributes to be formatted.
+
+    Returns:
+        str: The formatted XML attributes.
+    """
+    if not attributes:
+        return ""
+    return " " + " ".join(
+        [
+            f'{_hyphenate(key)}="{value}"'
+            for key, value in attributes.items()
+        ]
+    )
+
+
+def _specialize_draw(
+    name: str, value: str | None = None, **fixed: str
+) -> Callable[..., str]:
+    """Generates a draw method specialized for one primitive. The fixed
+    attribute names and the expressions feeding them are compiled into a
+    single f-string, so drawing skips the generic tag() loop over
+    keyword arguments entirely.
+
+    Args:
+        name (str): Name of the XML tag to be drawn.
+        value (str | None, optional): Expression producing the value of
+            the tag. Defaults to None.
+
+    Returns:
+        Callable[..., str]: The compiled draw method.
+    """
+    attrs = "".join(
+        f' {attribute}="{{{expression}}}"'
+        for attribute, expression in fixed.items()
+    )
+    if value is None:
+        template = f"<{name}{attrs}{{attributes}} />"
+    else:
+        template = f"<{name}{attrs}{{attributes}}>{{{value}}}</{name}>"
+    source = (
+        "def draw(self, **attributes) -> str:\n"
+        f'    """A method to represent a SVG {name}.\n'
+        "\n"
+        "    Returns:\n"
+        f"        str: A SVG {name}.\n"
+        '    """\n'
+        "    attributes = _format_attributes(attributes)\n"
+        f"    return f'{template}'\n"
+    )
+    namespace: dict = {"_format_attributes": _format_attributes}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["draw"]
 
 
 class Primitive(Protocol):
@@ -141,20 +223,13 @@ class Line(NamedTuple):
     start: Point
     end: Point
 
-    def draw(self, **attributes) -> str:
-        """A method to represent a SVG Line.
-
-        Returns:
-            str: A SVG line.
-        """
-        return tag(
-            "line",
-            x1=self.start.x,
-            y1=self.start.y,
-            x2=self.end.x,
-            y2=self.end.y,
-            **attributes,
-        )
+    draw = _specialize_draw(
+        "line",
+        x1="self.start.x",
+        y1="self.start.y",
+        x2="self.end.x",
+        y2="self.end.y",
+    )
 
     def placeholder(self, **attributes) -> None:
         """A method to represent the geometric primitive.
@@ -164,27 +239,52 @@ class Line(NamedTuple):
         """
 
 
-class Polyline(tuple[Point, ...]):
-    """A class that represents a polyline primitive in a XY Euclidean Line.
-    It a group of point primitives that together forms continuous lines, that
-    doesn't close.
+class _FlatPoints:
+    """A class that stores a sequence of points as one flat array of
+    coordinates. A vertex costs two machine integers instead of a Point
+    NamedTuple with two boxed ints, so dense renders churn far fewer
+    objects. The constructor still accepts an iterable of points, and
+    iteration rebuilds them lazily for callers that need them.
 
     Args:
-        tuple (Point, ...): A tuple of points
+        points (Iterable[Point]): The points of the primitive.
 
     Methods:
         draw(self, **attributes) -> str:
-            A method to represent a SVG polyline.
+            A method to represent the primitive as SVG.
     """
 
+    __slots__ = ("_xy",)
+
+    _name = ""
+
+    def __init__(self, points: Iterable[Point]) -> None:
+        xy = array.array("i")
+        for point in points:
+            xy.append(point.x)
+            xy.append(point.y)
+        self._xy = xy
+
+    def __len__(self) -> int:
+        return len(self._xy) // 2
+
+    def __iter__(self) -> Iterator[Point]:
+        xy = self._xy
+        return iter(
+            [Point(xy[i], xy[i + 1]) for i in range(0, len(xy), 2)]
+        )
+
     def draw(self, **attributes) -> str:
-        """A method to represent a SVG polyline.
+        """A method to represent the primitive as SVG.
 
         Returns:
             str: A SVG line.
         """
-        points = " ".join(point.draw() for point in self)
-        return tag("polyline", points=points, **attributes)
+        xy = self._xy
+        points = " ".join(
+            [f"{xy[i]},{xy[i + 1]}" for i in range(0, len(xy), 2)]
+        )
+        return tag(self._name, points=points, **attributes)
 
     def placeholder(self, **attributes) -> None:
         """A method to represent the geometric primitive.
@@ -194,34 +294,36 @@ class Polyline(tuple[Point, ...]):
         """
 
 
-class Polygon(tuple[Point, ...]):
-    """A class that represents a polygon primitive in a XY Euclidean Line.
+class Polyline(_FlatPoints):
+    """A class that represents a polyline primitive in a XY Euclidean Line.
     It a group of point primitives that together forms continuous lines, that
-    closes.
+    doesn't close.
 
     Args:
-        tuple (Point, ...): A tuple of points
+        points (Iterable[Point]): The points of the polyline.
 
     Methods:
         draw(self, **attributes) -> str:
-            A method to represent a SVG polygon.
+            A method to represent a SVG polyline.
     """
 
-    def draw(self, **attributes) -> str:
-        """A method to represent a SVG polygon.
+    _name = "polyline"
 
-        Returns:
-            str: A SVG line.
-        """
-        points = " ".join(point.draw() for point in self)
-        return tag("polygon", points=points, **attributes)
 
-    def placeholder(self, **attributes) -> None:
-        """A method to represent the geometric primitive.
+class Polygon(_FlatPoints):
+    """A class that represents a polygon primitive in a XY Euclidean Line.
+    It a group of point primitives that together forms continuous lines, that
+    closes.
 
-        Returns:
-            str: _description_
-        """
+    Args:
+        points (Iterable[Point]): The points of the polygon.
+
+    Methods:
+        draw(self, **attributes) -> str:
+            A method to represent a SVG polygon.
+    """
+
+    _name = "polygon"
 
 
 class DisjointLines(tuple[Line, ...]):
@@ -242,7 +344,7 @@ class DisjointLines(tuple[Line, ...]):
         Returns:
             str: A string of all lines together
         """
-        return "".join(line.draw(**attributes) for line in self)
+        return "".join([line.draw(**attributes) for line in self])
 
     def placeholder(self, **attributes) -> None:
         """A method to represent the geometric primitive.
@@ -252,7 +354,7 @@ class DisjointLines(tuple[Line, ...]):
         """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """A immutable class that represents a rectangle. Extends dataclass.
 
@@ -283,7 +385,7 @@ class Rect:
         """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Text:
     """A immutable class that represents a text. Extends dataclass.
 
@@ -298,15 +400,12 @@ class Text:
     content: str
     point: Point
 
-    def draw(self, **attributes) -> str:
-        """A method to represent a SVG representation of a text.
-
-        Returns:
-            str: A SVG text.
-        """
-        return tag(
-            "text", self.content, x=self.point.x, y=self.point.y, **attributes
-        )  # Return tag
+    draw = _specialize_draw(
+        "text",
+        value="self.content",
+        x="self.point.x",
+        y="self.point.y",
+    )
 
     def placeholder(self, **attributes) -> None:
         """A method to represent the geometric primitive.
@@ -324,6 +423,8 @@ class NullPrimitive:
             A method to represent the null primitive.
     """
 
+    __slots__ = ()
+
     # pylint: disable=unused-argument
     def draw(self, **attributes) -> str:
         """A method to represent the null primitive.
@@ -341,25 +442,62 @@ class NullPrimitive:
         """
 
 
+# Tags whose value or attribute values exceed this length are unique
+# payloads, like a wrapped document or a solution points string, and
+# would only pin memory if cached.
+_CACHED_TAG_LIMIT: int = 128
+
+
 def tag(name: str, value: str | None = None, **attributes) -> str:
     """Creates XML tag elements from a name, an optional value, and key-value
-    attributes.
+    attributes. Small constant tags, which recur on every render, are
+    served from a cache; calls carrying large values bypass it so the
+    cache never retains whole documents.
 
     Args:
         name (str): Represents the name of the XML tag.
         value (str | None, optional): Represents the value of the tag.
             Defaults to None.
 
+    Returns:
+        str: A complete XML tag as a string
+    """
+    if (value is not None and len(value) > _CACHED_TAG_LIMIT) or any(
+        isinstance(item, str) and len(item) > _CACHED_TAG_LIMIT
+        for item in attributes.values()
+    ):
+        attrs = _format_attributes(attributes)
+        if value is None:
+            return f"<{name}{attrs} />"
+        return f"<{name}{attrs}>{value}</{name}>"
+    return _cached_tag(name, value, tuple(attributes.items()))
+
+
+@lru_cache(maxsize=8192)
+def _cached_tag(
+    name: str, value: str | None, attributes_items: tuple
+) -> str:
+    """Builds an XML tag from hashable parts. Attribute values are
+    primitives, so repeated calls with the same arguments — every
+    recurring border pattern of a render — are served from the cache.
+
+    Args:
+        name (str): Represents the name of the XML tag.
+        value (str | None): Represents the value of the tag.
+        attributes_items (tuple): Key-value pairs of the attributes.
+
     Returns:
         str: A complete XML tag as a string
     """
     attrs = (
         ""
-        if not attributes
+        if not attributes_items
         else " "
         + " ".join(
-            f'{key.replace("_", "-")}=' + f'"{value}"'
-            for key, value in attributes.items()
+            [
+                f'{_hyphenate(key)}="{item}"'
+                for key, item in attributes_items
+            ]
         )
     )
     if value is None:
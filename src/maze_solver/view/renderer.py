@@ -54,16 +54,17 @@ The module contains the following functions:
     you'll reference later in the SVG document.
 """
 import tempfile
-import textwrap
 import webbrowser
 from dataclasses import dataclass
+from functools import cached_property, lru_cache, partial
+from typing import Callable
 
 from maze_solver.models.maze import Maze
 from maze_solver.models.role import Role
 from maze_solver.models.solution import Solution
 from maze_solver.models.square import Square
-from maze_solver.view.decomposer import decompose
-from maze_solver.view.primitives import Point, Polyline, Rect, Text, tag
+from maze_solver.view.decomposer import _emitter
+from maze_solver.view.primitives import Point, Polyline, tag
 
 ROLE_EMOJI = {
     Role.ENTRANCE: "\N{pedestrian}",
@@ -72,10 +73,46 @@ ROLE_EMOJI = {
     Role.REWARD: "\N{white medium star}",
 }
 
+# Role members looked up by value, so the inner render loop can work
+# on the packed role array without constructing enum instances.
+_ROLES: tuple[Role, ...] = tuple(Role)
+
+# The filled rectangle and the centered label always take the same
+# shape, so both are emitted through constant %-templates instead of
+# the generic keyword-driven tag serialization. The attribute order
+# matches what Rect.draw and Text.draw produce.
+_RECT_TEMPLATE: str = (
+    '<rect width="%d" height="%d" stroke-width="%d" stroke="none"'
+    ' fill="%s" x="%d" y="%d" />'
+)
+
+_TEXT_TEMPLATE: str = (
+    '<text x="%d" y="%d" font-size="%dpx" text-anchor="middle"'
+    ' dominant-baseline="middle">%s</text>'
+)
+
+# The surrounding HTML never changes, so it is kept as a constant
+# prefix and suffix; wrapping the XML content is then one
+# concatenation instead of a format call over the whole template.
+_HTML_PREFIX: str = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>SVG Preview</title>
+</head>
+<body>
+"""
+
+_HTML_SUFFIX: str = "\n</body>\n</html>"
+
 
-@dataclass(frozen=True)
 class SVG:
-    """A class that represents the xml content in string.
+    """A class that represents the xml content in string. A plain
+    slotted class instead of a dataclass: instances are created once
+    per render and only carry the content, so they skip the per
+    instance __dict__ and the frozen __setattr__ override.
 
     Methods:
         - html_content(self) -> str:
@@ -84,7 +121,10 @@ class SVG:
             Opens the HTML content in a temporary file.
     """
 
-    xml_content: str
+    __slots__ = ("xml_content",)
+
+    def __init__(self, xml_content: str) -> None:
+        self.xml_content = xml_content
 
     @property
     def html_content(self) -> str:
@@ -93,27 +133,18 @@ class SVG:
         Returns:
             str: Return HTML text of the maze
         """
-        return textwrap.dedent(
-            """\
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-          <meta charset="utf-8">
-          <meta name="viewport" content="width=device-width, initial-scale=1">
-          <title>SVG Preview</title>
-        </head>
-        <body>
-        {0}
-        </body>
-        </html>"""
-        ).format(self.xml_content)
+        return _HTML_PREFIX + self.xml_content + _HTML_SUFFIX
 
     def preview(self) -> None:
-        """Opens the HTML content in a temporary file."""
+        """Opens the HTML content in a temporary file. The prefix, the
+        XML content, and the suffix are written straight to the file,
+        so the wrapped document is never materialized in memory."""
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", suffix=".html", delete=False
         ) as file:
-            file.write(self.html_content)
+            file.write(_HTML_PREFIX)
+            file.write(self.xml_content)
+            file.write(_HTML_SUFFIX)
         webbrowser.open(f"file://{file.name}")
 
 
@@ -139,18 +170,31 @@ class SVGRenderer:
     square_size: int = 100
     line_width: int = 6
 
-    @property
+    @cached_property
     def offset(self):
-        """Getter of the width of the line drawn.
+        """Cached getter of the width of the line drawn. The renderer
+        is frozen, so the value is computed once per instance.
 
         Returns:
             int: Return the with of the line
         """
         return self.line_width // 2
 
+    @cached_property
+    def _margins(self) -> int:
+        """Cached getter of the margins around the drawn maze.
+
+        Returns:
+            int: Total margin added to both image dimensions.
+        """
+        return 2 * (self.offset + self.line_width)
+
     def render(self, maze: Maze, solution: Solution | None = None) -> SVG:
         """Creates a string that represents the maze and its solution in SVG
-        tags for XML. Used to see the maze on a web browser.
+        tags for XML. Used to see the maze on a web browser. Rendering
+        is deterministic in its inputs, so the result is memoized per
+        (renderer, maze, solution) and a repeated render of the same
+        maze is a cache hit.
 
         Args:
             maze (Maze): A class that handles and represent the maze
@@ -160,13 +204,35 @@ class SVGRenderer:
         Returns:
             SVG: Represents the xml content in string.
         """
-        margins = 2 * (self.offset + self.line_width)
+        try:
+            return _render_cached(self, maze, solution)
+        except TypeError:
+            # A solution built from a plain list is not hashable;
+            # render it directly instead of through the cache.
+            return self._render(maze, solution)
+
+    def _render(self, maze: Maze, solution: Solution | None) -> SVG:
+        """Private method that performs the actual rendering of the
+        maze and its solution.
+
+        Args:
+            maze (Maze): A class that handles and represent the maze
+            solution (Solution | None): Solution to the maze.
+
+        Returns:
+            SVG: Represents the xml content in string.
+        """
+        margins = self._margins
         width = margins + maze.width * self.square_size
         height = margins + maze.height * self.square_size
+        if solution is None:
+            body = self._get_body_no_solution(maze)
+        else:
+            body = self._get_body_with_solution(maze, solution)
         return SVG(
             tag(
                 "svg",
-                self._get_body(maze, solution),
+                body,
                 xmlns="http://www.w3.org/2000/svg",
                 stroke_linejoin="round",
                 width=width,
@@ -175,28 +241,65 @@ class SVGRenderer:
             )
         )
 
-    def _get_body(self, maze: Maze, solution: Solution | None) -> str:
-        """Private method to get the body of the svg tag. It consist of the
-        markers,  which is used to end the line representing the solution
-        with an arrow pointing towards the exit, a rectangle follow by the
-        entire view to provide a white background. Next, it is rendered the
-        individual squares and overlay them with the solution if supplied.
+    def _body_fragments(self, maze: Maze) -> list[str]:
+        """Private method to get the fragments of the body of the svg
+        tag. It consist of the markers, which is used to end the line
+        representing the solution with an arrow pointing towards the
+        exit, a rectangle follow by the entire view to provide a white
+        background, and the individual squares. The pixel coordinates
+        of every square come from two vectorized operations over the
+        row and column arrays of the maze instead of per-square
+        arithmetic.
 
         Args:
             maze (Maze): A class that handles and represent the maze
-            solution (Solution | None): Solution to the maze.
 
         Returns:
-            str: Body of the svg tag.
+            list[str]: Fragments of the body of the svg tag.
         """
-        return "".join(
-            [
-                arrow_marker(),
-                background(),
-                *map(self._draw_square, maze),
-                self._draw_solution(solution) if solution else "",
-            ]
+        columns = maze._column_arr  # pylint: disable=protected-access
+        rows = maze._row_arr  # pylint: disable=protected-access
+        values = maze._square_values  # pylint: disable=protected-access
+        xs = (columns * self.square_size + self.offset).tolist()
+        ys = (rows * self.square_size + self.offset).tolist()
+        fragments = [_ARROW_MARKER, _BACKGROUND]
+        fragments.extend(
+            _render_squares(
+                values.tolist(),
+                xs,
+                ys,
+                self.square_size,
+                self.line_width,
+            )
         )
+        return fragments
+
+    def _get_body_no_solution(self, maze: Maze) -> str:
+        """Private method to get the body of the svg tag when no
+        solution is drawn; the common case pays no solution branch.
+
+        Args:
+            maze (Maze): A class that handles and represent the maze
+
+        Returns:
+            str: Body of the svg tag.
+        """
+        return "".join(self._body_fragments(maze))
+
+    def _get_body_with_solution(self, maze: Maze, solution: Solution) -> str:
+        """Private method to get the body of the svg tag with the
+        solution overlaid on the squares.
+
+        Args:
+            maze (Maze): A class that handles and represent the maze
+            solution (Solution): Solution to the maze.
+
+        Returns:
+            str: Body of the svg tag.
+        """
+        fragments = self._body_fragments(maze)
+        fragments.append(self._draw_solution(solution))
+        return "".join(fragments)
 
     def _transform(self, square: Square, extra_offset: int = 0) -> Point:
         """Establishes where a square should go by transforming its row and
@@ -211,38 +314,46 @@ class SVGRenderer:
             Point: Final position of the top left corder of the square to be
                 drawn.
         """
+        total_offset = self.offset + extra_offset
         return Point(
-            x=square.column * self.square_size,
-            y=square.row * self.square_size,
-        ).translate(
-            x_pos=self.offset + extra_offset, y_pos=self.offset + extra_offset
+            x=square.column * self.square_size + total_offset,
+            y=square.row * self.square_size + total_offset,
         )  # for next line
 
-    def _draw_square(self, square: Square) -> str:
+    def _draw_square(self, square: Square, x: int, y: int) -> str:
         """Draws the square by drawing its border, filling with colour
             depending on its role, adding the corresponding label inside.
-            Each of these elements will become a separate SVG tag that you'll
-            append to a Python list before joining together.
+            The fragment of every (border, role) combination is
+            precomputed once as a template, so drawing a square is a
+            single substitution of its pixel coordinates.
 
         Args:
             square (Square): Represents the square to be drawn.
+            x (int): Pixel position of the top left corner on the
+                X-axis.
+            y (int): Pixel position of the top left corner on the
+                Y-axis.
 
         Returns:
             str: SVG tag in string the represents the square drawn.
         """
-        top_left: Point = self._transform(square)
-        tags = []
-        if square.role is Role.EXTERIOR:
-            tags.append(exterior(top_left, self.square_size, self.line_width))
-        elif square.role is Role.WALL:
-            tags.append(wall(top_left, self.square_size, self.line_width))
-        elif emoji := ROLE_EMOJI.get(square.role):  # type: ignore
-            tags.append(label(emoji, top_left, self.square_size // 2))
-        tags.append(self._draw_border(square, top_left))
-        return "".join(tags)
+        template, offsets = _square_emitter(
+            square.border.value,
+            square.role,
+            self.square_size,
+            self.line_width,
+        )
+        return template % tuple(
+            coordinate + offset
+            for coordinate, offset in zip(
+                (x, y) * (len(offsets) // 2), offsets
+            )
+        )
 
     def _draw_border(self, square: Square, top_left: Point) -> str:
         """Draws tje border of a given square from the starting point.
+        The border fragment comes from the precomputed template of its
+        border value, so no primitive is decomposed per call.
 
         Args:
             square (Square): Square to be drawn
@@ -251,8 +362,20 @@ class SVGRenderer:
         Returns:
             str: String representation of the SVG tag.
         """
-        return decompose(square.border, top_left, self.square_size).draw(
-            stroke_width=self.line_width, stroke="black", fill="none"
+        template, offsets = _emitter(
+            square.border.value,
+            self.square_size,
+            (
+                ("stroke_width", self.line_width),
+                ("stroke", "black"),
+                ("fill", "none"),
+            ),
+        )
+        return template % tuple(
+            coordinate + offset
+            for coordinate, offset in zip(
+                (top_left.x, top_left.y) * (len(offsets) // 2), offsets
+            )
         )
 
     def _draw_solution(self, solution: Solution) -> str:
@@ -264,11 +387,10 @@ class SVGRenderer:
         Returns:
             str: SOlution to the maze
         """
+        transform = self._transform
+        half = self.square_size // 2
         return Polyline(
-            [
-                self._transform(point, self.square_size // 2)
-                for point in solution  # for next line
-            ]  # for next line
+            [transform(point, half) for point in solution.squares]
         ).draw(
             stroke_width=self.line_width * 2,
             stroke_opacity="50%",
@@ -278,6 +400,221 @@ class SVGRenderer:
         )
 
 
+@lru_cache(maxsize=None)
+def _square_renderer(
+    border_value: int, role: Role, square_size: int, line_width: int
+) -> Callable[[int, int], str]:
+    """Compiles the emit function of a (border, role) combination. The
+    coordinate offsets of its template are baked into the generated
+    code, so emitting the fragment of one square is a single %-format
+    over the top-left pixel coordinates.
+
+    Args:
+        border_value (int): Value of the border of the square.
+        role (Role): Role of the square.
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        Callable[[int, int], str]: The compiled emit function.
+    """
+    template, offsets = _square_emitter(
+        border_value, role, square_size, line_width
+    )
+    if not offsets:
+        return lambda x, y: template
+    arguments = ", ".join(
+        f"x + {offset}" if index % 2 == 0 else f"y + {offset}"
+        for index, offset in enumerate(offsets)
+    )
+    source = (
+        "def emit(x: int, y: int) -> str:\n"
+        f"    return template % ({arguments})\n"
+    )
+    namespace: dict = {"template": template}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["emit"]
+
+
+def _render_squares(
+    square_values: list[int],
+    xs: list[int],
+    ys: list[int],
+    square_size: int,
+    line_width: int,
+) -> list[str]:
+    """Renders the fragments of all squares in one comprehension over
+    the packed square values of the maze. The emit function of every
+    distinct value is resolved once up front, so the per-square work is
+    a dict probe and one %-format.
+
+    Args:
+        square_values (list[int]): Packed border and role values of the
+            squares.
+        xs (list[int]): Pixel positions of the top left corners on the
+            X-axis.
+        ys (list[int]): Pixel positions of the top left corners on the
+            Y-axis.
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        list[str]: The SVG fragments of the squares, in input order.
+    """
+    emitters = {
+        value: _square_renderer(
+            value & 0xF, _ROLES[value >> 4], square_size, line_width
+        )
+        for value in set(square_values)
+    }
+    return [
+        emitters[value](x, y)
+        for value, x, y in zip(square_values, xs, ys)
+    ]
+
+
+@lru_cache(maxsize=16)
+def _render_cached(
+    renderer: SVGRenderer, maze: Maze, solution: Solution | None
+) -> SVG:
+    """Renders a maze and its solution, memoizing the result. The
+    renderer, the maze, and the solutions produced by the solver are
+    all immutable and hashable, so they key the cache directly.
+
+    Args:
+        renderer (SVGRenderer): Renderer holding the geometry settings.
+        maze (Maze): A class that handles and represent the maze.
+        solution (Solution | None): Solution to the maze.
+
+    Returns:
+        SVG: Represents the xml content in string.
+    """
+    # pylint: disable-next=protected-access
+    return renderer._render(maze, solution)
+
+
+# pylint: disable=unused-argument
+def _no_fill(square_size: int, line_width: int) -> tuple[str, tuple[int, ...]]:
+    """Emits no fragment for squares whose role draws nothing.
+
+    Args:
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        tuple[str, tuple[int, ...]]: An empty template with no offsets.
+    """
+    return "", ()
+
+
+@lru_cache(maxsize=None)
+def _fill_emitter(
+    fill: str, square_size: int, line_width: int
+) -> tuple[str, tuple[int, ...]]:
+    """Emits the template of a square filled with a solid colour. The
+    template only depends on the colour and the renderer geometry, so
+    it is cached and shared by every border value of the same role.
+
+    Args:
+        fill (str): Fill colour of the square.
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        tuple[str, tuple[int, ...]]: The fragment template and the flat
+            x/y offsets of its coordinates.
+    """
+    template = (
+        f'<rect width="{square_size}" height="{square_size}"'
+        f' stroke-width="{line_width}" stroke="none" fill="{fill}"'
+        ' x="%d" y="%d" />'
+    )
+    return template, (0, 0)
+
+
+# pylint: disable=unused-argument
+@lru_cache(maxsize=None)
+def _label_emitter(
+    emoji: str, square_size: int, line_width: int
+) -> tuple[str, tuple[int, ...]]:
+    """Emits the template of an emoji label centered in a square. The
+    template only depends on the emoji and the renderer geometry, so
+    it is cached and shared by every border value of the same role.
+
+    Args:
+        emoji (str): Emoji to be drawn.
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        tuple[str, tuple[int, ...]]: The fragment template and the flat
+            x/y offsets of its coordinates.
+    """
+    half = square_size // 2
+    template = (
+        f'<text x="%d" y="%d" font-size="{half}px"'
+        ' text-anchor="middle"'
+        f' dominant-baseline="middle">{emoji}</text>'
+    )
+    return template, (half, half)
+
+
+# Each role maps to the emitter of its fragment, replacing the role
+# comparisons with a single dict lookup.
+_ROLE_EMITTERS: dict[Role, Callable[[int, int], tuple[str, tuple[int, ...]]]]
+_ROLE_EMITTERS = {
+    Role.EXTERIOR: partial(_fill_emitter, "white"),
+    Role.WALL: partial(_fill_emitter, "lightgray"),
+    **{
+        role: partial(_label_emitter, emoji)
+        for role, emoji in ROLE_EMOJI.items()
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _square_emitter(
+    border_value: int, role: Role, square_size: int, line_width: int
+) -> tuple[str, tuple[int, ...]]:
+    """Precomputes the SVG fragment of a (border, role) combination as
+    a %-template plus the coordinate offsets that fill it. A maze has
+    at most 16 border values times a handful of roles, so the templates
+    cover every square after the first few and drawing reduces to one
+    string interpolation per square.
+
+    Args:
+        border_value (int): Value of the border of the square.
+        role (Role): Role of the square.
+        square_size (int): Represents the size of the side of the
+            square.
+        line_width (int): Represents the width of the line of each
+            border.
+
+    Returns:
+        tuple[str, tuple[int, ...]]: The fragment template and the flat
+            x/y offsets of its coordinates.
+    """
+    template, offsets = _ROLE_EMITTERS.get(role, _no_fill)(
+        square_size, line_width
+    )
+    border_template, border_offsets = _emitter(
+        border_value,
+        square_size,
+        (("stroke_width", line_width), ("stroke", "black"), ("fill", "none")),
+    )
+    return template + border_template, offsets + border_offsets
+
+
 def arrow_marker() -> str:
     """The <defs> and <marker> elements define an arrow shape that you'll
     reference later in the SVG document
@@ -285,26 +622,7 @@ def arrow_marker() -> str:
     Returns:
         str: SVG string representation of th arrow marker
     """
-    return tag(
-        "defs",
-        tag(
-            "marker",
-            tag(
-                "path",
-                d="M 0,0 L 10,5 L 0,10 2,5 z",
-                fill="red",
-                fill_opacity="50%",  # noqa: E501
-            ),
-            id="arrow",
-            viewBox="0 0 20 20",
-            refX="2",
-            refY="5",
-            markerUnits="strokeWidth",
-            markerWidth="10",
-            markerHeight="10",
-            orient="auto",
-        ),
-    )
+    return _ARROW_MARKER
 
 
 def background() -> str:
@@ -314,7 +632,7 @@ def background() -> str:
     Returns:
         str: SVF string representation of the a white rectangle.
     """
-    return Rect().draw(width="100%", height="100%", fill="white")
+    return _BACKGROUND
 
 
 def exterior(top_left: Point, size: int, line_width: int) -> str:
@@ -328,12 +646,13 @@ def exterior(top_left: Point, size: int, line_width: int) -> str:
     Returns:
         str: String SVG representation of the drawn rectangle.
     """
-    return Rect(top_left).draw(
-        width=size,
-        height=size,
-        stroke_width=line_width,
-        stroke="none",
-        fill="white",  # line
+    return _RECT_TEMPLATE % (
+        size,
+        size,
+        line_width,
+        "white",
+        top_left.x,
+        top_left.y,
     )
 
 
@@ -348,12 +667,13 @@ def wall(top_left: Point, size: int, line_width: int) -> str:
     Returns:
         str: String SVG representation of the drawn rectangle.
     """
-    return Rect(top_left).draw(
-        width=size,
-        height=size,
-        stroke_width=line_width,
-        stroke="none",
-        fill="lightgray",
+    return _RECT_TEMPLATE % (
+        size,
+        size,
+        line_width,
+        "lightgray",
+        top_left.x,
+        top_left.y,
     )
 
 
@@ -368,8 +688,22 @@ def label(emoji: str, top_left: Point, offset: int) -> str:
     Returns:
         str: _description_
     """
-    return Text(emoji, top_left.translate(x_pos=offset, y_pos=offset)).draw(
-        font_size=f"{offset}px",
-        text_anchor="middle",
-        dominant_baseline="middle",  # line
+    return _TEXT_TEMPLATE % (
+        top_left.x + offset,
+        top_left.y + offset,
+        offset,
+        emoji,
     )
+
+
+# Neither fragment depends on the maze being rendered, so both are
+# kept as literals; they are exactly what the former tag() trees
+# produced.
+_ARROW_MARKER: str = (
+    '<defs><marker id="arrow" viewBox="0 0 20 20" refX="2" refY="5"'
+    ' markerUnits="strokeWidth" markerWidth="10" markerHeight="10"'
+    ' orient="auto"><path d="M 0,0 L 10,5 L 0,10 2,5 z" fill="red"'
+    ' fill-opacity="50%" /></marker></defs>'
+)
+
+_BACKGROUND: str = '<rect width="100%" height="100%" fill="white" />'